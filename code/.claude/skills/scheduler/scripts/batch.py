@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Shared batch-mode helpers for the scheduler scripts.
+
+Each scheduler script accepts --batch path.jsonl with one JSON operation
+per line. Instead of paying Python startup plus a process spawn per
+operation, the whole file is executed in one pass: on Windows every
+schtasks command is piped into a single persistent PowerShell session,
+on macOS the per-record handlers run in-process.
+"""
+
+import json
+import re
+import shutil
+import subprocess
+import sys
+
+# pwsh 7 starts ~2x faster than Windows PowerShell 5; fall back when absent
+_POWERSHELL = shutil.which('pwsh') or 'powershell'
+
+# Names are spliced into the per-command line written to the PowerShell
+# session, so only allow the documented Task_Name_HHMM convention
+_SAFE_NAME = re.compile(r'^[\w.-]+$')
+
+
+def _ps_quote(arg):
+    """Quote one argument for PowerShell (single quotes, '' for embedded ')."""
+    return "'" + arg.replace("'", "''") + "'"
+
+
+def load_operations(path):
+    """Read one JSON operation per line, skipping blank lines."""
+    operations = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                operations.append(json.loads(line))
+    return operations
+
+
+def _run_windows_session(commands):
+    """
+    Run many schtasks commands in one persistent PowerShell session.
+
+    commands: list of (name, argv) pairs. Returns the set of names whose
+    command reported success.
+    """
+    proc = subprocess.Popen(
+        [_POWERSHELL, '-NoProfile', '-NonInteractive', '-Command', '-'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+
+    # Quote each argv element for PowerShell's own parser (list2cmdline's
+    # backslash escapes are Win32 quoting, which PowerShell re-tokenizes
+    # into corrupted /tr values) and invoke via the & call operator.
+    # communicate() feeds stdin while draining stdout, so a large batch
+    # can't deadlock on a full pipe buffer.
+    script = ''.join(
+        f'& {" ".join(_ps_quote(a) for a in argv)} ; if ($?) {{ Write-Output "OK:{name}" }}\n'
+        for name, argv in commands
+    )
+    stdout, _ = proc.communicate(script)
+
+    succeeded = set()
+    for line in stdout.splitlines():
+        line = line.strip()
+        if line.startswith('OK:'):
+            succeeded.add(line[3:])
+
+    return succeeded
+
+
+def run_batch(path, is_windows, windows_command, handler):
+    """
+    Execute a JSONL batch of operations.
+
+    windows_command(record) builds the schtasks argv for one record;
+    handler(record) runs one record in-process and returns
+    (success, message) - used on macOS. Every record needs a 'name' key.
+    Prints one SUCCESS/ERROR line per record and returns the number of
+    failed operations.
+    """
+    operations = load_operations(path)
+    failed = 0
+
+    if is_windows:
+        commands = []
+        for record in operations:
+            try:
+                name = record['name']
+                if not _SAFE_NAME.match(name):
+                    raise ValueError("task name must contain only letters, digits, '_', '.' or '-'")
+                commands.append((name, windows_command(record)))
+            except Exception as e:
+                print(f"ERROR: {record.get('name', '?')}: {e}", file=sys.stderr)
+                failed += 1
+
+        succeeded = _run_windows_session(commands)
+
+        for name, _ in commands:
+            if name in succeeded:
+                print(f"SUCCESS: {name}")
+            else:
+                print(f"ERROR: {name}", file=sys.stderr)
+                failed += 1
+    else:
+        for record in operations:
+            try:
+                success, message = handler(record)
+            except Exception as e:
+                success, message = False, f"{record.get('name', '?')}: {e}"
+
+            if success:
+                print(f"SUCCESS: {message}")
+            else:
+                print(f"ERROR: {message}", file=sys.stderr)
+                failed += 1
+
+    return failed
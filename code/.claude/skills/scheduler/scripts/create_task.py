@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Create a scheduled task for the Asystent bot (cross-platform: Windows/macOS/Linux).
+
+Usage:
+    python create_task.py --name "TaskName" --prompt "Your prompt" --schedule "daily 09:00"
+    python create_task.py --name "TaskName" --prompt "Your prompt" --schedule "in 2 minutes"
+    python create_task.py --name "TaskName" --prompt "Your prompt" --schedule "weekly SUN 20:00"
+"""
+
+import argparse
+import subprocess
+import sys
+import platform
+import getpass
+import plistlib
+from datetime import datetime, timedelta
+from pathlib import Path
+import re
+import os
+
+import batch
+
+PLATFORM = platform.system()  # 'Windows', 'Darwin' (macOS), 'Linux'
+_IS_WINDOWS = PLATFORM == 'Windows'
+_IS_DARWIN = PLATFORM == 'Darwin'
+
+# Resolved once - getpass.getuser() walks env vars/passwd on every call
+_USERNAME = os.environ.get('USERNAME') or os.environ.get('USER') or getpass.getuser()
+
+# Schedule patterns compiled once at import (parse_natural_schedule is called
+# on every task creation)
+_RE_IN = re.compile(r'in (\d+) (minute|minutes|hour|hours)')
+_RE_DAILY = re.compile(r'daily(?: at)? (\d{1,2}):?(\d{2})')
+_RE_WEEKLY = re.compile(r'weekly ([a-z,]+) (\d{1,2}):?(\d{2})')
+_RE_MONTHLY = re.compile(r'monthly (\d{1,2}) (\d{1,2}):?(\d{2})')
+
+# Day names to launchd weekday numbers (Sunday = 0 in launchd)
+_DAY_MAP = {
+    'MON': 1, 'MONDAY': 1,
+    'TUE': 2, 'TUESDAY': 2,
+    'WED': 3, 'WEDNESDAY': 3,
+    'THU': 4, 'THURSDAY': 4,
+    'FRI': 5, 'FRIDAY': 5,
+    'SAT': 6, 'SATURDAY': 6,
+    'SUN': 0, 'SUNDAY': 0
+}
+
+
+def parse_natural_schedule(schedule_str):
+    """
+    Parse natural language schedule into structured format.
+
+    Returns: dict with keys: type, time, date (optional), days (optional)
+    """
+    schedule_str = schedule_str.lower().strip()
+
+    # "in X minutes/hours"
+    if match := _RE_IN.match(schedule_str):
+        amount = int(match.group(1))
+        unit = match.group(2)
+
+        if unit.startswith('minute'):
+            delta = timedelta(minutes=amount)
+        else:  # hour
+            delta = timedelta(hours=amount)
+
+        target = datetime.now() + delta
+
+        return {
+            'type': 'once',
+            'time': target.strftime('%H:%M'),
+            'date': target.strftime('%d/%m/%Y'),  # Windows format
+            'datetime': target  # Full datetime for macOS
+        }
+
+    # "daily HH:MM" or "daily at HH:MM"
+    if match := _RE_DAILY.match(schedule_str):
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        return {
+            'type': 'daily',
+            'time': f'{hour:02d}:{minute:02d}',
+            'hour': hour,
+            'minute': minute
+        }
+
+    # "weekly DAY HH:MM" or "weekly DAY,DAY HH:MM"
+    if match := _RE_WEEKLY.match(schedule_str):
+        days_str = match.group(1).upper()
+        hour = int(match.group(2))
+        minute = int(match.group(3))
+
+        days_abbrev = []
+        days_weekday = []
+        for day in days_str.split(','):
+            day = day.strip()
+            if day in _DAY_MAP:
+                days_abbrev.append(day[:3])
+                days_weekday.append(_DAY_MAP[day])
+
+        return {
+            'type': 'weekly',
+            'time': f'{hour:02d}:{minute:02d}',
+            'hour': hour,
+            'minute': minute,
+            'days': ','.join(days_abbrev),  # For Windows: "MON,WED,FRI"
+            'weekdays': days_weekday  # For macOS: [1, 3, 5]
+        }
+
+    # "monthly day HH:MM"
+    if match := _RE_MONTHLY.match(schedule_str):
+        day = int(match.group(1))
+        hour = int(match.group(2))
+        minute = int(match.group(3))
+
+        return {
+            'type': 'monthly',
+            'time': f'{hour:02d}:{minute:02d}',
+            'hour': hour,
+            'minute': minute,
+            'day': day
+        }
+
+    raise ValueError(f"Could not parse schedule: {schedule_str}")
+
+
+def build_schtasks_command(task_name, prompt, schedule_info, trigger_script):
+    """Build the schtasks argv for one task creation."""
+
+    # Escape prompt for PowerShell
+    safe_prompt = prompt.replace(' ', '_').replace('"', '').replace("'", '')
+
+    tr_path = f'powershell -NoProfile -NonInteractive -File {trigger_script} "{safe_prompt}"'
+
+    # schtasks.exe is native - invoke it directly instead of spawning
+    # cmd.exe + PowerShell around it
+    cmd = ['schtasks', '/create', '/tn', task_name, '/tr', tr_path]
+
+    # Add schedule type
+    if schedule_info['type'] == 'once':
+        cmd += ['/sc', 'once', '/st', schedule_info['time'], '/sd', schedule_info['date']]
+    elif schedule_info['type'] == 'daily':
+        cmd += ['/sc', 'daily', '/st', schedule_info['time']]
+    elif schedule_info['type'] == 'weekly':
+        cmd += ['/sc', 'weekly', '/d', schedule_info['days'], '/st', schedule_info['time']]
+    elif schedule_info['type'] == 'monthly':
+        cmd += ['/sc', 'monthly', '/d', str(schedule_info['day']), '/st', schedule_info['time']]
+
+    # Run as current user with highest privileges, force overwrite
+    cmd += ['/ru', _USERNAME, '/rl', 'HIGHEST', '/f']
+
+    return cmd
+
+
+def create_windows_task(task_name, prompt, schedule_info, trigger_script):
+    """Create Windows Task Scheduler task using schtasks."""
+
+    cmd = build_schtasks_command(task_name, prompt, schedule_info, trigger_script)
+
+    # Execute
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.returncode == 0:
+        return True, f"Task '{task_name}' created successfully"
+    else:
+        return False, result.stderr
+
+
+def create_macos_task(task_name, prompt, schedule_info, trigger_script):
+    """Create macOS launchd task using .plist file."""
+
+    # LaunchAgents directory
+    launch_agents_dir = Path.home() / "Library" / "LaunchAgents"
+    launch_agents_dir.mkdir(parents=True, exist_ok=True)
+
+    # Plist filename
+    plist_name = f"com.asystent.{task_name}.plist"
+    plist_path = launch_agents_dir / plist_name
+
+    payload = {
+        'Label': f'com.asystent.{task_name}',
+        'ProgramArguments': [trigger_script, prompt],
+    }
+
+    # Build StartCalendarInterval based on schedule type
+    if schedule_info['type'] == 'once':
+        # For one-time tasks, use StartCalendarInterval with specific date/time
+        dt = schedule_info['datetime']
+        payload['StartCalendarInterval'] = {
+            'Month': dt.month,
+            'Day': dt.day,
+            'Hour': dt.hour,
+            'Minute': dt.minute,
+        }
+    elif schedule_info['type'] == 'daily':
+        # Daily at specific time
+        payload['StartCalendarInterval'] = {
+            'Hour': schedule_info['hour'],
+            'Minute': schedule_info['minute'],
+        }
+    elif schedule_info['type'] == 'weekly':
+        # Weekly - need one interval per weekday
+        payload['StartCalendarInterval'] = [
+            {
+                'Weekday': weekday,
+                'Hour': schedule_info['hour'],
+                'Minute': schedule_info['minute'],
+            }
+            for weekday in schedule_info['weekdays']
+        ]
+    elif schedule_info['type'] == 'monthly':
+        # Monthly on specific day
+        payload['StartCalendarInterval'] = {
+            'Day': schedule_info['day'],
+            'Hour': schedule_info['hour'],
+            'Minute': schedule_info['minute'],
+        }
+
+    # Write plist file (plistlib escapes task_name/prompt for XML)
+    plist_path.write_bytes(plistlib.dumps(payload))
+
+    # Load into launchd
+    result = subprocess.run(
+        ['launchctl', 'load', str(plist_path)],
+        capture_output=True,
+        text=True
+    )
+
+    if result.returncode == 0:
+        return True, f"Task '{task_name}' created at {plist_path}"
+    else:
+        return False, f"Failed to load task: {result.stderr}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Create scheduled task for Asystent bot (cross-platform)')
+    parser.add_argument('--name', help='Task name (e.g., Daily_Plan_0900)')
+    parser.add_argument('--prompt', help='Prompt for trigger script')
+    parser.add_argument('--schedule', help='Schedule in natural language')
+    parser.add_argument('--trigger-script', help='Path to trigger script (auto-detected if not provided)')
+    parser.add_argument('--batch', help='JSONL file of tasks to create in one pass (keys: name, prompt, schedule)')
+
+    args = parser.parse_args()
+
+    if not args.batch and not (args.name and args.prompt and args.schedule):
+        parser.error('--name, --prompt and --schedule are required unless --batch is given')
+
+    # Auto-detect trigger script path if not provided
+    if not args.trigger_script:
+        script_dir = Path(__file__).parent.parent.parent.parent / "scripts"
+        if _IS_WINDOWS:
+            args.trigger_script = str(script_dir / "trigger-bot-prompt.ps1")
+        else:
+            args.trigger_script = str(script_dir / "trigger-bot-prompt.sh")
+
+    if args.batch:
+        if not (_IS_WINDOWS or _IS_DARWIN):
+            print("ERROR: Linux not yet supported. Please use cron manually.", file=sys.stderr)
+            sys.exit(1)
+
+        def windows_command(record):
+            schedule_info = parse_natural_schedule(record['schedule'])
+            return build_schtasks_command(record['name'], record['prompt'], schedule_info, args.trigger_script)
+
+        def macos_handler(record):
+            schedule_info = parse_natural_schedule(record['schedule'])
+            return create_macos_task(record['name'], record['prompt'], schedule_info, args.trigger_script)
+
+        failed = batch.run_batch(args.batch, _IS_WINDOWS, windows_command, macos_handler)
+        sys.exit(1 if failed else 0)
+
+    try:
+        # Parse schedule
+        schedule_info = parse_natural_schedule(args.schedule)
+
+        # Create task based on platform
+        if _IS_WINDOWS:
+            success, message = create_windows_task(args.name, args.prompt, schedule_info, args.trigger_script)
+        elif _IS_DARWIN:  # macOS
+            success, message = create_macos_task(args.name, args.prompt, schedule_info, args.trigger_script)
+        else:  # Linux - use cron (future implementation)
+            print("ERROR: Linux not yet supported. Please use cron manually.", file=sys.stderr)
+            sys.exit(1)
+
+        if success:
+            print(f"SUCCESS: {message}")
+            print(f"Schedule: {schedule_info}")
+            sys.exit(0)
+        else:
+            print(f"ERROR: {message}", file=sys.stderr)
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
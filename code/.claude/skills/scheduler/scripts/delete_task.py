@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Delete a scheduled task (cross-platform).
+
+Usage:
+    python delete_task.py --name "TaskName"
+"""
+
+import argparse
+import subprocess
+import sys
+import platform
+import os
+from pathlib import Path
+
+import batch
+
+PLATFORM = platform.system()
+_IS_WINDOWS = PLATFORM == 'Windows'
+_IS_DARWIN = PLATFORM == 'Darwin'
+
+
+def delete_windows_task(task_name):
+    """Delete Windows Task Scheduler task."""
+    cmd = ['schtasks', '/delete', '/tn', task_name, '/f']
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.returncode == 0:
+        return True, f"Task '{task_name}' deleted"
+    else:
+        return False, result.stderr
+
+
+def delete_macos_task(task_name):
+    """Delete macOS launchd task."""
+    label = f"com.asystent.{task_name}"
+    plist_path = Path.home() / "Library" / "LaunchAgents" / f"{label}.plist"
+
+    if not plist_path.exists():
+        return False, f"Task '{task_name}' not found"
+
+    # bootout is idempotent - one call whether or not the job is loaded
+    # (an already-inactive job just returns non-zero, which we ignore)
+    subprocess.run(
+        ['launchctl', 'bootout', f'gui/{os.getuid()}', str(plist_path)],
+        capture_output=True
+    )
+
+    # Delete plist file
+    try:
+        plist_path.unlink()
+        return True, f"Task '{task_name}' deleted"
+    except Exception as e:
+        return False, f"Failed to delete plist: {e}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Delete scheduled task')
+    parser.add_argument('--name', help='Task name to delete')
+    parser.add_argument('--batch', help='JSONL file of tasks to delete in one pass (key: name)')
+
+    args = parser.parse_args()
+
+    if not args.batch and not args.name:
+        parser.error('--name is required unless --batch is given')
+
+    if args.batch:
+        if not (_IS_WINDOWS or _IS_DARWIN):
+            print("ERROR: Linux not yet supported", file=sys.stderr)
+            sys.exit(1)
+
+        def windows_command(record):
+            return ['schtasks', '/delete', '/tn', record['name'], '/f']
+
+        def macos_handler(record):
+            return delete_macos_task(record['name'])
+
+        failed = batch.run_batch(args.batch, _IS_WINDOWS, windows_command, macos_handler)
+        sys.exit(1 if failed else 0)
+
+    if _IS_WINDOWS:
+        success, message = delete_windows_task(args.name)
+    elif _IS_DARWIN:
+        success, message = delete_macos_task(args.name)
+    else:
+        print("ERROR: Linux not yet supported", file=sys.stderr)
+        sys.exit(1)
+
+    if success:
+        print(f"SUCCESS: {message}")
+        sys.exit(0)
+    else:
+        print(f"ERROR: {message}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Disable (deactivate) a scheduled task (cross-platform).
+
+Usage:
+    python disable_task.py --name "TaskName"
+"""
+
+import argparse
+import subprocess
+import sys
+import platform
+from pathlib import Path
+
+import batch
+
+PLATFORM = platform.system()
+_IS_WINDOWS = PLATFORM == 'Windows'
+_IS_DARWIN = PLATFORM == 'Darwin'
+
+
+def disable_windows_task(task_name):
+    """Disable Windows Task Scheduler task."""
+    cmd = ['schtasks', '/change', '/tn', task_name, '/disable']
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.returncode == 0:
+        return True, f"Task '{task_name}' disabled"
+    else:
+        return False, result.stderr
+
+
+def disable_macos_task(task_name):
+    """Disable macOS launchd task by unloading it."""
+    label = f"com.asystent.{task_name}"
+    plist_path = Path.home() / "Library" / "LaunchAgents" / f"{label}.plist"
+
+    if not plist_path.exists():
+        return False, f"Task '{task_name}' not found"
+
+    result = subprocess.run(
+        ['launchctl', 'unload', str(plist_path)],
+        capture_output=True,
+        text=True
+    )
+
+    if result.returncode == 0:
+        return True, f"Task '{task_name}' disabled (unloaded)"
+    else:
+        return False, f"Failed to disable: {result.stderr}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Disable scheduled task')
+    parser.add_argument('--name', help='Task name to disable')
+    parser.add_argument('--batch', help='JSONL file of tasks to disable in one pass (key: name)')
+
+    args = parser.parse_args()
+
+    if not args.batch and not args.name:
+        parser.error('--name is required unless --batch is given')
+
+    if args.batch:
+        if not (_IS_WINDOWS or _IS_DARWIN):
+            print("ERROR: Linux not yet supported", file=sys.stderr)
+            sys.exit(1)
+
+        def windows_command(record):
+            return ['schtasks', '/change', '/tn', record['name'], '/disable']
+
+        def macos_handler(record):
+            return disable_macos_task(record['name'])
+
+        failed = batch.run_batch(args.batch, _IS_WINDOWS, windows_command, macos_handler)
+        sys.exit(1 if failed else 0)
+
+    if _IS_WINDOWS:
+        success, message = disable_windows_task(args.name)
+    elif _IS_DARWIN:
+        success, message = disable_macos_task(args.name)
+    else:
+        print("ERROR: Linux not yet supported", file=sys.stderr)
+        sys.exit(1)
+
+    if success:
+        print(f"SUCCESS: {message}")
+        sys.exit(0)
+    else:
+        print(f"ERROR: {message}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Get execution history for a scheduled task (cross-platform).
+
+Usage:
+    python get_task_history.py --name "TaskName" [--limit 10]
+"""
+
+import argparse
+import subprocess
+import sys
+import platform
+import shutil
+import json
+from datetime import datetime, timedelta
+
+# orjson parses ~5x faster than stdlib json; fall back when not installed
+try:
+    import orjson
+
+    def _loads(data):
+        # orjson wants bytes - encoding up front skips its internal decode
+        return orjson.loads(data.encode() if isinstance(data, str) else data)
+
+    _JSONDecodeError = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+PLATFORM = platform.system()
+
+# pwsh 7 starts ~2x faster than Windows PowerShell 5; fall back when absent
+_POWERSHELL = shutil.which('pwsh') or 'powershell'
+
+
+def get_windows_history(task_name, limit=10):
+    """
+    Get task execution history from Windows Event Viewer.
+
+    Event IDs:
+    - 100: Task started
+    - 102: Task completed successfully
+    - 103: Task failed to start
+    - 201: Task execution failed
+    """
+
+    # Filter server-side: the XPath matches the indexed TaskName field
+    # inside the event-log service, so no event message is ever rendered
+    # and only 'limit' events come back instead of limit*4. The Python
+    # side derives the status from the ID, so Message isn't selected.
+    xpath = (
+        "*[System[(EventID=100 or EventID=102 or EventID=103 or EventID=201)]]"
+        f" and *[EventData[Data[@Name='TaskName']='\\{task_name}']]"
+    )
+    ps_cmd = (
+        f"Get-WinEvent -LogName 'Microsoft-Windows-TaskScheduler/Operational' "
+        f'-FilterXPath "{xpath}" -MaxEvents {limit} | '
+        'Select-Object TimeCreated, Id | ConvertTo-Json'
+    )
+
+    cmd = [_POWERSHELL, '-NoProfile', '-NonInteractive', '-Command', ps_cmd]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.returncode != 0:
+        return []
+
+    try:
+        events = _loads(result.stdout)
+        if not isinstance(events, list):
+            events = [events]
+
+        history = []
+        for event in events:
+            event_id = event['Id']
+            time_created = event['TimeCreated']
+
+            # Determine status
+            if event_id == 100:
+                status = 'Started'
+            elif event_id == 102:
+                status = 'Completed'
+            elif event_id == 103:
+                status = 'Failed to start'
+            elif event_id == 201:
+                status = 'Failed'
+            else:
+                status = 'Unknown'
+
+            history.append({
+                'time': time_created,
+                'status': status,
+                'event_id': event_id
+            })
+
+        return history
+
+    except _JSONDecodeError:
+        return []
+
+
+def get_macos_history(task_name, limit=10):
+    """
+    Get task execution history from macOS system log.
+    """
+    label = f"com.asystent.{task_name}"
+
+    # Query logs from last 7 days
+    since = (datetime.now() - timedelta(days=7)).isoformat()
+
+    # Use 'log show' to query system logs. ndjson emits one event per
+    # line (--style json would be a single pretty-printed array), which
+    # is what the streaming loop below parses.
+    cmd = [
+        'log', 'show',
+        '--predicate', f'process == "launchd" AND eventMessage CONTAINS "{label}"',
+        '--style', 'ndjson',
+        '--start', since
+    ]
+
+    # Stream the output instead of buffering a multi-megabyte string:
+    # parsing overlaps log show's work and memory stays O(one line)
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=1 << 16
+    )
+
+    history = []
+
+    try:
+        # Parse JSON output line by line (orjson takes the raw bytes)
+        for line in proc.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = _loads(line)
+                message = event.get('eventMessage', '')
+
+                # Filter for relevant events
+                if label in message:
+                    timestamp = event.get('timestamp', '')
+
+                    # Determine status from message
+                    if 'start' in message.lower():
+                        status = 'Started'
+                    elif 'exited' in message.lower():
+                        if 'code 0' in message or 'successfully' in message.lower():
+                            status = 'Completed'
+                        else:
+                            status = 'Failed'
+                    else:
+                        status = 'Info'
+
+                    history.append({
+                        'time': timestamp,
+                        'status': status,
+                        'message': message[:200]
+                    })
+
+                    if len(history) == limit:
+                        # Enough events - stop log show instead of reading
+                        # the rest of the 7-day window
+                        proc.terminate()
+                        break
+
+            except _JSONDecodeError:
+                continue
+
+        return history
+
+    except Exception:
+        return history
+
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Get scheduled task execution history')
+    parser.add_argument('--name', required=True, help='Task name')
+    parser.add_argument('--limit', type=int, default=10, help='Number of events to retrieve')
+    parser.add_argument('--json', action='store_true', help='Output as JSON')
+
+    args = parser.parse_args()
+
+    if PLATFORM == 'Windows':
+        history = get_windows_history(args.name, args.limit)
+    elif PLATFORM == 'Darwin':
+        history = get_macos_history(args.name, args.limit)
+    else:
+        print("ERROR: Linux not yet supported", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(history, indent=2))
+    else:
+        if not history:
+            print(f"No execution history found for task '{args.name}'")
+        else:
+            print(f"\nExecution history for '{args.name}':\n")
+            for event in history:
+                print(f"  {event['time']} - {event['status']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+List scheduled tasks created by Asystent bot (cross-platform).
+
+Usage:
+    python list_tasks.py [--prefix PREFIX] [--json]
+"""
+
+import argparse
+import subprocess
+import sys
+import platform
+import csv
+import json
+from pathlib import Path
+
+PLATFORM = platform.system()
+
+
+def list_windows_tasks(prefix=None):
+    """List Windows Task Scheduler tasks."""
+    # One verbose query up front (schtasks.exe is native - no PowerShell
+    # wrapper) instead of a per-task /query /tn fan-out. Streaming the
+    # pipe keeps memory at one row instead of buffering the whole CSV.
+    proc = subprocess.Popen(
+        ['schtasks', '/query', '/fo', 'CSV', '/v', '/nh'],
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=-1
+    )
+
+    tasks = []
+
+    for line in proc.stdout:
+        # Cheap substring check before any CSV parsing - only Asystent
+        # tasks mention the trigger script in their command
+        if 'trigger-bot-prompt' not in line:
+            continue
+
+        row = next(csv.reader([line]), None)
+        if not row or len(row) < 4:
+            continue
+
+        # /v /nh columns: HostName, TaskName, Next Run Time, Status, ...
+        # (positional on purpose - schtasks localizes the header names,
+        # e.g. "Nazwa zadania" on Polish Windows)
+        task_name = row[1].split('\\')[-1]  # Get name without path
+
+        if prefix and not task_name.startswith(prefix):
+            continue
+
+        tasks.append({
+            'name': task_name,
+            'status': row[3],
+            'next_run': row[2]
+        })
+
+    proc.wait()
+
+    if proc.returncode != 0:
+        return []
+
+    return tasks
+
+
+def list_macos_tasks(prefix=None):
+    """List macOS launchd tasks."""
+    # Get list of plist files in LaunchAgents
+    launch_agents_dir = Path.home() / "Library" / "LaunchAgents"
+
+    if not launch_agents_dir.exists():
+        return []
+
+    # launchctl list prints the same output on every iteration - run it
+    # once and index the labels (last column) for O(1) lookups
+    result = subprocess.run(
+        ['launchctl', 'list'],
+        capture_output=True,
+        text=True
+    )
+    loaded = {
+        line.split()[-1]
+        for line in result.stdout.splitlines()[1:]  # Skip header
+        if line.strip()
+    }
+
+    tasks = []
+
+    for plist_file in launch_agents_dir.glob("com.asystent.*.plist"):
+        task_name = plist_file.stem.replace("com.asystent.", "")
+
+        if prefix and not task_name.startswith(prefix):
+            continue
+
+        label = f"com.asystent.{task_name}"
+        is_loaded = label in loaded
+
+        tasks.append({
+            'name': task_name,
+            'status': 'Loaded' if is_loaded else 'Not loaded',
+            'plist': str(plist_file)
+        })
+
+    return tasks
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List Asystent scheduled tasks')
+    parser.add_argument('--prefix', help='Filter tasks by name prefix')
+    parser.add_argument('--json', action='store_true', help='Output as JSON')
+
+    args = parser.parse_args()
+
+    # Get tasks based on platform
+    if PLATFORM == 'Windows':
+        tasks = list_windows_tasks(args.prefix)
+    elif PLATFORM == 'Darwin':
+        tasks = list_macos_tasks(args.prefix)
+    else:
+        print("ERROR: Linux not yet supported", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(tasks, indent=2))
+    else:
+        if not tasks:
+            print("No Asystent tasks found")
+        else:
+            print(f"\nFound {len(tasks)} task(s):\n")
+            for task in tasks:
+                print(f"  • {task['name']}")
+                print(f"    Status: {task['status']}")
+                if 'next_run' in task:
+                    print(f"    Next run: {task['next_run']}")
+                if 'plist' in task:
+                    print(f"    Plist: {task['plist']}")
+                print()
+
+
+if __name__ == '__main__':
+    main()